@@ -15,9 +15,12 @@ import app.models.reminder
 config = context.config
 
 
-sync_url = settings.DATABASE_URL.replace("+asyncpg", "+psycopg")
+sync_url = settings.DATABASE_URL.replace("+asyncpg", "+psycopg").replace("+aiosqlite", "")
 config.set_main_option("sqlalchemy.url", sync_url)
 
+# sqlite can't ALTER most things in place, batch mode recreates the table instead
+render_as_batch = sync_url.startswith("sqlite")
+
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
 if config.config_file_name is not None:
@@ -54,6 +57,7 @@ def run_migrations_offline() -> None:
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
         compare_type=True,
+        render_as_batch=render_as_batch,
     )
 
     with context.begin_transaction():
@@ -76,6 +80,7 @@ def run_migrations_online() -> None:
     with connectable.connect() as connection:
         context.configure(
             connection=connection, target_metadata=target_metadata, compare_type=True,
+            render_as_batch=render_as_batch,
         )
 
         with context.begin_transaction():
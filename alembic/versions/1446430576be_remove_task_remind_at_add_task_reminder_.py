@@ -31,14 +31,16 @@ def upgrade() -> None:
     sa.PrimaryKeyConstraint('id')
     )
     op.create_index(op.f('ix_task_reminders_task_id'), 'task_reminders', ['task_id'], unique=False)
-    op.drop_column('tasks', 'remind_at')
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.drop_column('remind_at')
     # ### end Alembic commands ###
 
 
 def downgrade() -> None:
     """Downgrade schema."""
     # ### commands auto generated by Alembic - please adjust! ###
-    op.add_column('tasks', sa.Column('remind_at', postgresql.TIMESTAMP(), autoincrement=False, nullable=True))
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.add_column(sa.Column('remind_at', postgresql.TIMESTAMP(), autoincrement=False, nullable=True))
     op.drop_index(op.f('ix_task_reminders_task_id'), table_name='task_reminders')
     op.drop_table('task_reminders')
     # ### end Alembic commands ###
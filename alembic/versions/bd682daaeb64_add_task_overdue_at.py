@@ -0,0 +1,49 @@
+"""add task.overdue_at and index for the overdue sweeper
+
+Revision ID: bd682daaeb64
+Revises: cfa48184d283
+Create Date: 2026-10-19 15:37:52.204817
+
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'bd682daaeb64'
+down_revision: Union[str, Sequence[str], None] = 'cfa48184d283'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.add_column(sa.Column('overdue_at', sa.DateTime(), nullable=True))
+
+    # tasks that are already past due count as handled, the sweeper only escalates new ones
+    tasks = sa.table('tasks', sa.column('due_at', sa.DateTime()), sa.column('overdue_at', sa.DateTime()))
+    op.execute(
+        tasks.update()
+        .where(tasks.c.due_at <= datetime.utcnow())
+        .values(overdue_at=tasks.c.due_at)
+    )
+
+    op.create_index(
+        'ix_tasks_unswept_due_at',
+        'tasks',
+        ['due_at'],
+        unique=False,
+        postgresql_where=sa.text("overdue_at IS NULL AND status IN ('pending', 'in_progress')"),
+        sqlite_where=sa.text("overdue_at IS NULL AND status IN ('pending', 'in_progress')"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_unswept_due_at', table_name='tasks')
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.drop_column('overdue_at')
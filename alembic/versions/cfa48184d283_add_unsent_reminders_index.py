@@ -0,0 +1,35 @@
+"""add partial index on unsent task_reminders
+
+Revision ID: cfa48184d283
+Revises: 1446430576be
+Create Date: 2026-10-19 12:04:18.517342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'cfa48184d283'
+down_revision: Union[str, Sequence[str], None] = '1446430576be'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_task_reminders_unsent_remind_at',
+        'task_reminders',
+        ['remind_at', 'task_id'],
+        unique=False,
+        postgresql_where=sa.text('is_sent IS false'),
+        sqlite_where=sa.text('is_sent IS 0'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_task_reminders_unsent_remind_at', table_name='task_reminders')
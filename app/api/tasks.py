@@ -1,26 +1,50 @@
-from datetime import datetime, timezone
+from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import selectinload
 from sqlalchemy import select
 
 from app.db import get_db
 from app.models import Task
-from app.schemas.task import TaskCreate, TaskOut, TaskUpdate
+from app.schemas.task import TaskCreate, TaskOut, TaskUpdate, TaskWithRemindersOut
 
 router = APIRouter(
     prefix="/tasks",
     tags=["tasks"]
 )
 
+INCLUDE_OPTIONS = {"reminders"}
+
+
+def parse_include(include: str | None = Query(None)) -> set[str]:
+    if not include:
+        return set()
+
+    requested = {part.strip() for part in include.split(",") if part.strip()}
+    unknown = requested - INCLUDE_OPTIONS
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown include: {', '.join(sorted(unknown))}"
+        )
+    return requested
+
+
+def serialize_task(task: Task, include: set[str]) -> TaskOut:
+    # reminders are only touched when they were eager-loaded, lazy loads fail under AsyncSession
+    if "reminders" in include:
+        return TaskWithRemindersOut.model_validate(task)
+    return TaskOut.model_validate(task)
+
 
 @router.post("/", response_model=TaskOut, status_code=status.HTTP_201_CREATED)
 async def create_task(
         payload: TaskCreate,
         db: AsyncSession = Depends(get_db)
 ):
-    now = datetime.now(timezone.utc)
+    now = datetime.utcnow()
 
     if payload.due_at and payload.due_at < now:
         raise HTTPException(
@@ -28,18 +52,6 @@ async def create_task(
             detail="due_at must be in the future"
         )
 
-    if payload.remind_at and payload.remind_at < now:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="remind_at must be in the future"
-        )
-
-    if payload.due_at and payload.remind_at and payload.remind_at > payload.due_at:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="remind_at must be <= due_at"
-        )
-
     task = Task(**payload.model_dump())
     db.add(task)
     try:
@@ -54,23 +66,42 @@ async def create_task(
     return task
 
 
-@router.get("/", response_model=list[TaskOut], status_code=status.HTTP_200_OK)
-async def list_tasks(db: AsyncSession = Depends(get_db)):
+@router.get(
+    "/",
+    response_model=list[TaskWithRemindersOut | TaskOut],
+    status_code=status.HTTP_200_OK
+)
+async def list_tasks(
+        include: set[str] = Depends(parse_include),
+        db: AsyncSession = Depends(get_db)
+):
     stmt = select(Task).order_by(Task.created_at.desc())
+    if "reminders" in include:
+        # one extra "WHERE task_id IN (...)" query for the whole page instead of one per task
+        stmt = stmt.options(selectinload(Task.reminders))
     result = await db.execute(stmt)
     tasks = result.scalars().all()
-    return tasks
+    return [serialize_task(task, include) for task in tasks]
 
 
-@router.get("/{task_id}", response_model=TaskOut, status_code=status.HTTP_200_OK)
-async def get_task(task_id: int, db: AsyncSession = Depends(get_db)):
-    task = await db.get(Task, task_id)
+@router.get(
+    "/{task_id}",
+    response_model=TaskWithRemindersOut | TaskOut,
+    status_code=status.HTTP_200_OK
+)
+async def get_task(
+        task_id: int,
+        include: set[str] = Depends(parse_include),
+        db: AsyncSession = Depends(get_db)
+):
+    options = [selectinload(Task.reminders)] if "reminders" in include else []
+    task = await db.get(Task, task_id, options=options)
     if not task:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Task not found"
         )
-    return task
+    return serialize_task(task, include)
 
 
 @router.patch("/{task_id}", response_model=TaskOut)
@@ -84,31 +115,23 @@ async def update_task(task_id: int, payload: TaskUpdate, db: AsyncSession = Depe
 
     data = payload.model_dump(exclude_unset=True)
 
-    now = datetime.now(timezone.utc)
     due_at = data.get("due_at", task.due_at)
-    remind_at = data.get("remind_at", task.remind_at)
+    deadline_changed = due_at != task.due_at
 
-    if due_at and due_at < now:
+    # only a new deadline is validated, an overdue task keeps its past one
+    if deadline_changed and due_at and due_at < datetime.utcnow():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="due_at must be in the future",
         )
 
-    if remind_at and remind_at < now:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="remind_at must be in the future",
-        )
-
-    if remind_at and due_at and remind_at > due_at:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="remind_at must be <= due_at",
-        )
-
     for field, value in data.items():
         setattr(task, field, value)
 
+    if deadline_changed:
+        # a new deadline has to be swept again
+        task.overdue_at = None
+
     await db.commit()
     await db.refresh(task)
     return task
@@ -0,0 +1,167 @@
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import shutil
+from functools import lru_cache
+from pathlib import Path
+
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+DIST_DIR = STATIC_DIR / "dist"
+MANIFEST_PATH = DIST_DIR / "manifest.json"
+
+COMPRESSIBLE_SUFFIXES = {".css", ".js", ".svg", ".json", ".txt", ".html"}
+
+# (encoding, file suffix) in order of preference
+ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+HASH_LENGTH = 16
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+
+
+def build() -> dict[str, str]:
+    """Fingerprint app/static into app/static/dist and write .gz/.br variants next to each file."""
+    if DIST_DIR.exists():
+        shutil.rmtree(DIST_DIR)
+    DIST_DIR.mkdir(parents=True)
+
+    manifest: dict[str, str] = {}
+
+    for source in sorted(STATIC_DIR.rglob("*")):
+        if not source.is_file() or DIST_DIR in source.parents:
+            continue
+
+        data = source.read_bytes()
+        relative = source.relative_to(STATIC_DIR)
+        hashed = relative.with_name(f"{relative.stem}.{content_hash(data)}{relative.suffix}")
+
+        target = DIST_DIR / hashed
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(data)
+
+        if source.suffix in COMPRESSIBLE_SUFFIXES:
+            # mtime=0 keeps the gzip output byte-identical between builds
+            target.with_name(target.name + ".gz").write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+            if brotli is not None:
+                target.with_name(target.name + ".br").write_bytes(brotli.compress(data, quality=11))
+
+        manifest[relative.as_posix()] = hashed.as_posix()
+
+    MANIFEST_PATH.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    return manifest
+
+
+@lru_cache
+def load_manifest() -> dict[str, str]:
+    if not MANIFEST_PATH.exists():
+        return {}
+    return json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+
+
+@lru_cache
+def asset_hashes() -> dict[str, str]:
+    """Content hash of every fingerprinted file, keyed by its path under dist/."""
+    hashes = {}
+    for source, hashed in load_manifest().items():
+        # "<stem>.<hash><suffix>", the stem itself may contain dots
+        start = len(Path(source).stem) + 1
+        hashes[hashed] = Path(hashed).name[start:start + HASH_LENGTH]
+    return hashes
+
+
+def static_url(path: str) -> str:
+    """URL of a static file, pointing at its fingerprinted copy once the assets are built."""
+    hashed = load_manifest().get(path)
+    if hashed is None:
+        return f"/static/{path}"
+    return f"/static/dist/{hashed}"
+
+
+def accepted_encodings(scope: Scope) -> set[str]:
+    accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+    accepted = set()
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        name, _, value = params.partition("=")
+        if name.strip() == "q":
+            try:
+                if float(value) == 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+class AssetStaticFiles(StaticFiles):
+    """
+    StaticFiles that serves fingerprinted files from dist/ as immutable,
+    picking a precompressed variant according to Accept-Encoding.
+    """
+
+    def file_response(
+            self,
+            full_path: str | os.PathLike[str],
+            stat_result: os.stat_result,
+            scope: Scope,
+            status_code: int = 200,
+    ) -> Response:
+        full_path = Path(full_path)
+        if DIST_DIR not in full_path.parents:
+            return super().file_response(full_path, stat_result, scope, status_code)
+
+        # .gz/.br variants and the manifest aren't assets of their own, the variants
+        # are only served through Accept-Encoding on the file they belong to
+        name_hash = asset_hashes().get(full_path.relative_to(DIST_DIR).as_posix())
+        if name_hash is None:
+            raise HTTPException(status_code=404)
+
+        headers = {
+            "cache-control": IMMUTABLE_CACHE_CONTROL,
+            "vary": "Accept-Encoding",
+            "etag": f'"{name_hash}"',
+        }
+        path = full_path
+
+        accepted = accepted_encodings(scope)
+        for encoding, suffix in ENCODINGS:
+            variant = full_path.with_name(full_path.name + suffix)
+            if encoding in accepted and variant.is_file():
+                path = variant
+                stat_result = variant.stat()
+                headers["content-encoding"] = encoding
+                headers["etag"] = f'"{name_hash}-{encoding}"'
+                break
+
+        response = FileResponse(
+            path,
+            status_code=status_code,
+            headers=headers,
+            media_type=mimetypes.guess_type(full_path.name)[0] or "text/plain",
+            stat_result=stat_result,
+        )
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
+
+
+if __name__ == "__main__":
+    for source, hashed in build().items():
+        print(f"{source} -> {hashed}")
@@ -1,6 +1,8 @@
 from pathlib import Path
+from typing import Literal
 
 from dotenv import load_dotenv
+from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -13,23 +15,46 @@ class Settings(BaseSettings):
     APP_NAME: str = "PingMeBot"
     ENV: str = "dev"
 
-    POSTGRES_DB: str
-    POSTGRES_USER: str
-    POSTGRES_PASSWORD: str
-    DB_HOST: str
-    DB_PORT: int
+    DB_BACKEND: Literal["postgres", "sqlite"] = "postgres"
 
-    REDIS_URL: str
+    POSTGRES_DB: str | None = None
+    POSTGRES_USER: str | None = None
+    POSTGRES_PASSWORD: str | None = None
+    DB_HOST: str | None = None
+    DB_PORT: int = 5432
+
+    SQLITE_PATH: Path = BASE_DIR / "pingmebot.sqlite3"
+
+    REDIS_URL: str | None = None
 
     TELEGRAM_BOT_TOKEN: str | None = None
 
+    # seconds between overdue sweeps, 0 disables the sweeper
+    OVERDUE_SWEEP_INTERVAL: int = 60
+    OVERDUE_SWEEP_BATCH: int = 500
+
+    @model_validator(mode="after")
+    def validate_postgres_settings(self):
+        if self.DB_BACKEND == "postgres":
+            required = ("POSTGRES_DB", "POSTGRES_USER", "POSTGRES_PASSWORD", "DB_HOST")
+            missing = [name for name in required if getattr(self, name) is None]
+            if missing:
+                raise ValueError(f"{', '.join(missing)} must be set when DB_BACKEND=postgres")
+        return self
+
     @property
-    def DATABASE_URL(self) -> str:
+    def POSTGRES_URL(self) -> str:
         return (
             f"postgresql+asyncpg://{self.POSTGRES_USER}:"
             f"{self.POSTGRES_PASSWORD}@{self.DB_HOST}:"
             f"{self.DB_PORT}/{self.POSTGRES_DB}"
         )
 
+    @property
+    def DATABASE_URL(self) -> str:
+        if self.DB_BACKEND == "sqlite":
+            return f"sqlite+aiosqlite:///{self.SQLITE_PATH}"
+        return self.POSTGRES_URL
+
 
 settings = Settings()
@@ -1,4 +1,6 @@
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import DeclarativeBase
 
 from app.config import settings
@@ -8,15 +10,69 @@ class Base(DeclarativeBase):
     pass
 
 
-engine = create_async_engine(
-    settings.DATABASE_URL,
-    echo=False
-)
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "foreign_keys": "ON",
+    "busy_timeout": "5000",
+    "temp_store": "MEMORY",
+    "cache_size": "-20000",
+    "mmap_size": "268435456",
+}
+
+
+def configure_sqlite(engine: AsyncEngine, writer: bool) -> None:
+    """
+    Take transaction control away from the sqlite driver and tune every new connection.
+
+    Writers open their transactions with BEGIN IMMEDIATE so the write lock is taken
+    up front instead of failing with "database is locked" when a read transaction
+    tries to upgrade. Readers are switched to query_only.
+    """
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        for name, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        if not writer:
+            cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def on_begin(conn):
+        conn.exec_driver_sql("BEGIN IMMEDIATE" if writer else "BEGIN")
+
+
+def create_engines(url: str) -> tuple[AsyncEngine, AsyncEngine]:
+    """Return (engine, read_engine); they are the same engine unless the backend is sqlite."""
+    if not url.startswith("sqlite"):
+        engine = create_async_engine(url, echo=False)
+        return engine, engine
+
+    # sqlite allows a single writer: one pooled connection makes writers queue up for it
+    engine = create_async_engine(url, echo=False, pool_size=1, max_overflow=0, pool_timeout=30)
+    read_engine = create_async_engine(url, echo=False, pool_size=5, max_overflow=5)
+    configure_sqlite(engine, writer=True)
+    configure_sqlite(read_engine, writer=False)
+    return engine, read_engine
+
+
+engine, read_engine = create_engines(settings.DATABASE_URL)
 
 
 async_session_maker = async_sessionmaker(engine, expire_on_commit=False)
+read_session_maker = async_sessionmaker(read_engine, expire_on_commit=False)
+
+
+async def dispose_engines() -> None:
+    await engine.dispose()
+    if read_engine is not engine:
+        await read_engine.dispose()
 
 
-async def get_db() -> AsyncSession:
-    async with async_session_maker() as session:
+async def get_db(request: Request) -> AsyncSession:
+    session_maker = read_session_maker if request.method in ("GET", "HEAD") else async_session_maker
+    async with session_maker() as session:
         yield session
@@ -1,12 +1,40 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
+from starlette.middleware.gzip import GZipMiddleware
+from app.assets import AssetStaticFiles, STATIC_DIR
 from app.config import settings
+from app.db import dispose_engines
+from app.sweeper import run_overdue_sweeper
 from app.api.tasks import router as tasks_router
 from app.web.routes import router as web_router
 
-app = FastAPI(title=settings.APP_NAME)  # или как ты назвал проект
 
-app.mount("/static", StaticFiles(directory="app/static"), name="static")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    sweeper = None
+    if settings.OVERDUE_SWEEP_INTERVAL > 0:
+        sweeper = asyncio.create_task(run_overdue_sweeper())
+
+    yield
+
+    if sweeper is not None:
+        sweeper.cancel()
+        try:
+            await sweeper
+        except asyncio.CancelledError:
+            pass
+    # aiosqlite keeps a worker thread per pooled connection, the process won't exit until they are closed
+    await dispose_engines()
+
+
+app = FastAPI(title=settings.APP_NAME, lifespan=lifespan)  # или как ты назвал проект
+
+# compresses rendered pages; precompressed static files already carry Content-Encoding and pass through
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
+app.mount("/static", AssetStaticFiles(directory=STATIC_DIR), name="static")
 
 
 @app.get("/health")
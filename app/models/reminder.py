@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Integer, ForeignKey, DateTime, Boolean
+from sqlalchemy import Integer, ForeignKey, DateTime, Boolean, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db import Base
@@ -8,6 +8,17 @@ from app.db import Base
 
 class TaskReminder(Base):
     __tablename__ = "task_reminders"
+    __table_args__ = (
+        # upcoming unsent reminders, used for the next_remind_at lookup on the board.
+        # The predicates match how is_(False) is rendered, otherwise the planners skip the index
+        Index(
+            "ix_task_reminders_unsent_remind_at",
+            "remind_at",
+            "task_id",
+            postgresql_where=text("is_sent IS false"),
+            sqlite_where=text("is_sent IS 0"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     task_id: Mapped[int] = mapped_column(
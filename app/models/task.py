@@ -1,13 +1,25 @@
 from datetime import datetime
-from sqlalchemy import String, Text, Enum, DateTime, Integer
+from sqlalchemy import String, Text, Enum, DateTime, Integer, Index, text
 from app.db import Base
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.schemas.task import TaskStatus
 
+# the sweeper renders its status filter as literals so both planners can match this predicate
+UNSWEPT_PREDICATE = "overdue_at IS NULL AND status IN ('pending', 'in_progress')"
+
 
 class Task(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        # active tasks the overdue sweeper hasn't handled yet, so a sweep reads just the new ones
+        Index(
+            "ix_tasks_unswept_due_at",
+            "due_at",
+            postgresql_where=text(UNSWEPT_PREDICATE),
+            sqlite_where=text(UNSWEPT_PREDICATE),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -19,6 +31,7 @@ class Task(Base):
     )
 
     due_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=False), nullable=True)
+    overdue_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=False), nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=False),
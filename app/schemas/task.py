@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from pydantic import BaseModel, field_validator
 
@@ -9,20 +9,23 @@ class TaskStatus(str, Enum):
     done = "done"
 
 
+def to_naive_utc(value: datetime | None) -> datetime | None:
+    """Columns hold naive UTC; aware input is converted, naive input is taken as UTC."""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
 class TaskBase(BaseModel):
     title: str
     description: str | None = None
     due_at: datetime | None = None
-    remind_at: datetime | None = None
     status: TaskStatus = TaskStatus.pending
 
-    @field_validator("remind_at")
+    @field_validator("due_at")
     @classmethod
-    def validate_remind_at(cls, v, info):
-        due_at = info.data.get("due_at")
-        if v and due_at and v > due_at:
-            raise ValueError("remind_at must be <= due_at")
-        return v
+    def normalize_due_at(cls, v):
+        return to_naive_utc(v)
 
 
 
@@ -34,14 +37,36 @@ class TaskUpdate(BaseModel):
     title: str | None = None
     description: str | None = None
     due_at: datetime | None = None
-    remind_at: datetime | None = None
     status: TaskStatus | None = None
 
+    @field_validator("due_at")
+    @classmethod
+    def normalize_due_at(cls, v):
+        return to_naive_utc(v)
+
 
-class TaskOut(TaskBase):
+class ReminderOut(BaseModel):
     id: int
+    remind_at: datetime
+    is_sent: bool
+
+    class Config:
+        from_attributes = True
+
+
+class TaskOut(BaseModel):
+    id: int
+    title: str
+    description: str | None = None
+    due_at: datetime | None = None
+    overdue_at: datetime | None = None
+    status: TaskStatus
     created_at: datetime
     updated_at: datetime
 
     class Config:
         from_attributes = True
+
+
+class TaskWithRemindersOut(TaskOut):
+    reminders: list[ReminderOut]
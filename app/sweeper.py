@@ -0,0 +1,94 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from sqlalchemy import DateTime, Insert, Update, bindparam, false, insert, literal, select, union_all, update
+
+from app.config import settings
+from app.db import async_session_maker
+from app.models import Task, TaskReminder
+from app.schemas.task import TaskStatus
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = [TaskStatus.pending, TaskStatus.in_progress]
+
+# reminders scheduled for a task right after it becomes overdue, relative to the sweep time
+ESCALATION_DELAYS = [timedelta(0), timedelta(hours=3), timedelta(days=1)]
+
+
+def mark_overdue(now: datetime, batch: int) -> Update:
+    """
+    Stamp overdue_at on up to `batch` active tasks whose deadline passed and return their ids.
+
+    The inner select walks ix_tasks_unswept_due_at in due_at order, which only holds
+    active tasks that were never swept, so the cost follows the number of newly
+    overdue tasks. Without the ORDER BY the planners guess that a seq scan finds
+    `batch` rows quickly and read the whole table instead. The outer overdue_at
+    check makes concurrent sweepers skip rows another one already took.
+    """
+    active_statuses = bindparam("active_statuses", ACTIVE_STATUSES, expanding=True, literal_execute=True)
+    newly_overdue = (
+        select(Task.id)
+        .where(
+            Task.overdue_at.is_(None),
+            Task.status.in_(active_statuses),
+            Task.due_at <= now
+        )
+        .order_by(Task.due_at)
+        .limit(batch)
+    )
+    return (
+        update(Task)
+        .where(Task.id.in_(newly_overdue), Task.overdue_at.is_(None))
+        .values(overdue_at=now)
+        .returning(Task.id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def schedule_escalations(now: datetime, task_ids: list[int]) -> Insert:
+    """One INSERT ... SELECT that adds every escalation reminder for all given tasks."""
+    per_delay = [
+        select(
+            Task.id,
+            literal(now + delay, DateTime()),
+            false(),
+            literal(now, DateTime()),
+        ).where(Task.id.in_(task_ids))
+        for delay in ESCALATION_DELAYS
+    ]
+    return insert(TaskReminder).from_select(
+        ["task_id", "remind_at", "is_sent", "created_at"],
+        union_all(*per_delay),
+    )
+
+
+async def sweep_overdue(now: datetime | None = None) -> int:
+    now = now or datetime.utcnow()
+    batch = settings.OVERDUE_SWEEP_BATCH
+    swept = 0
+
+    while True:
+        async with async_session_maker() as db:
+            result = await db.execute(mark_overdue(now, batch))
+            task_ids = list(result.scalars())
+            if task_ids:
+                await db.execute(schedule_escalations(now, task_ids))
+            await db.commit()
+
+        swept += len(task_ids)
+        if len(task_ids) < batch:
+            return swept
+
+
+async def run_overdue_sweeper() -> None:
+    while True:
+        try:
+            swept = await sweep_overdue()
+            if swept:
+                logger.info("marked %s tasks overdue", swept)
+        except Exception:
+            logger.exception("overdue sweep failed")
+
+        await asyncio.sleep(settings.OVERDUE_SWEEP_INTERVAL)
@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, delete, update, func
 from fastapi.responses import RedirectResponse
 from fastapi.templating import Jinja2Templates
+from app.assets import static_url
 from app.schemas.task import TaskStatus
 from app.db import get_db
 from app.models import Task, TaskReminder
@@ -12,6 +13,7 @@ from app.models import Task, TaskReminder
 router = APIRouter(tags=["web"])
 
 templates = Jinja2Templates(directory="app/templates")
+templates.env.globals["static_url"] = static_url
 
 
 @router.get("/", include_in_schema=False)
@@ -217,6 +219,7 @@ async def update_task_page(
 
     task.title = title
     task.description = description or None
+    previous_due_at = task.due_at
     now = datetime.now()
 
     if due_at:
@@ -227,6 +230,10 @@ async def update_task_page(
     else:
         task.due_at = None
 
+    if task.due_at != previous_due_at:
+        # a new deadline has to be swept again
+        task.overdue_at = None
+
     if status:
         try:
             task.status = TaskStatus(status)
@@ -0,0 +1,124 @@
+"""
+Latency benchmark for the hot queries, runnable against either storage backend.
+
+    python -m perf.latency --backend sqlite
+    python -m perf.latency --backend postgres
+
+Seeds a scratch database through the same engine setup the app uses (a temporary
+file for sqlite, <POSTGRES_DB>_query_plans for postgres) and prints p50/p95 per query
+from perf.query_plans.HOT_QUERIES, so the two backends can be compared side by side.
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import insert, make_url, select
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.config import settings
+from app.db import Base, create_engines
+from app.models import Task, TaskReminder
+from app.schemas.task import TaskStatus
+from perf.query_plans import (
+    HOT_QUERIES,
+    NOW,
+    SELECTIN_BATCH,
+    SeedContext,
+    recreate_database,
+    reminder_rows,
+    task_rows,
+)
+
+DEFAULT_TASKS = 20_000
+INSERT_CHUNK = 5_000
+
+
+async def insert_chunked(engine: AsyncEngine, table, rows: list[dict]) -> None:
+    async with engine.begin() as conn:
+        for start in range(0, len(rows), INSERT_CHUNK):
+            await conn.execute(insert(table), rows[start:start + INSERT_CHUNK])
+
+
+async def seed(engine: AsyncEngine, tasks: int) -> SeedContext:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    await insert_chunked(engine, Task, task_rows(tasks))
+
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            select(Task.id, Task.status, Task.due_at, Task.created_at).where(Task.due_at.is_not(None))
+        )
+        tasks_with_deadline = result.all()
+    await insert_chunked(engine, TaskReminder, reminder_rows(tasks_with_deadline))
+
+    async with engine.connect() as conn:
+        task_id = (await conn.execute(
+            select(Task.id)
+            .join(TaskReminder, TaskReminder.task_id == Task.id)
+            .where(Task.status == TaskStatus.pending, TaskReminder.is_sent.is_(False))
+            .order_by(Task.id)
+            .limit(1)
+        )).scalar_one()
+        page_ids = list((await conn.execute(
+            select(Task.id).order_by(Task.id).limit(SELECTIN_BATCH)
+        )).scalars())
+
+    return SeedContext(now=NOW, task_id=task_id, page_ids=page_ids)
+
+
+async def measure(engine: AsyncEngine, read_engine: AsyncEngine, ctx: SeedContext, repeat: int) -> None:
+    print(f"{'query':<40} {'p50 ms':>10} {'p95 ms':>10}")
+    for query in HOT_QUERIES:
+        stmt = query.build(ctx)
+        timings = []
+        for _ in range(repeat):
+            async with (engine if stmt.is_dml else read_engine).connect() as conn:
+                started = time.perf_counter()
+                result = await conn.execute(stmt)
+                if result.returns_rows:
+                    result.all()
+                timings.append((time.perf_counter() - started) * 1000)
+                await conn.rollback()
+
+        timings.sort()
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        print(f"{query.name:<40} {statistics.median(timings):>10.2f} {p95:>10.2f}")
+
+
+async def run(backend: str, tasks: int, repeat: int, database: str) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        if backend == "sqlite":
+            url = f"sqlite+aiosqlite:///{Path(tmp) / 'bench.sqlite3'}"
+        else:
+            recreate_database(database)
+            url = make_url(settings.POSTGRES_URL).set(database=database).render_as_string(hide_password=False)
+
+        engine, read_engine = create_engines(url)
+
+        started = time.perf_counter()
+        ctx = await seed(engine, tasks)
+        print(f"{backend}: seeded {tasks} tasks in {time.perf_counter() - started:.2f} s")
+
+        await measure(engine, read_engine, ctx, repeat)
+
+        await engine.dispose()
+        await read_engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=["sqlite", "postgres"], default=settings.DB_BACKEND)
+    parser.add_argument("--tasks", type=int, default=DEFAULT_TASKS, help="number of seeded tasks")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--database", default=f"{settings.POSTGRES_DB}_query_plans")
+    args = parser.parse_args()
+
+    asyncio.run(run(args.backend, args.tasks, args.repeat, args.database))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,476 @@
+"""
+Query plan regression checks.
+
+Seeds a scratch database at realistic volume, explains every hot query of the app and
+fails when a plan scans a large table in full or no longer matches the recorded
+baseline shape.
+
+    python -m perf.query_plans --backend postgres                    # check against the baseline
+    python -m perf.query_plans --backend sqlite --update-baseline    # accept the current plans
+
+On postgres the plans come from EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) and the buffer
+and row budgets are checked too. The scratch database (<POSTGRES_DB>_query_plans by
+default) lives on the same server as the app database and is dropped and re-seeded on
+every run. On sqlite the plans come from EXPLAIN QUERY PLAN, which doesn't execute the
+query, so only the plan shape is checked; the database is a temporary file. Its plans
+follow the sqlite library Python links against (the baseline is from 3.40), so record
+the baseline again after upgrading it.
+"""
+import argparse
+import difflib
+import json
+import sys
+import tempfile
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable
+
+from sqlalchemy import Engine, create_engine, delete, func, insert, make_url, select, text, update
+from sqlalchemy.sql import Executable
+
+from app.config import settings
+from app.db import Base
+from app.models import Task, TaskReminder
+from app.schemas.task import TaskStatus
+from app.sweeper import mark_overdue, schedule_escalations
+
+PERF_DIR = Path(__file__).resolve().parent
+
+BASELINE_PATHS = {
+    "postgres": PERF_DIR / "query_plans_baseline.json",
+    "sqlite": PERF_DIR / "query_plans_baseline.sqlite.json",
+}
+
+DEFAULT_TASKS = 200_000
+
+# tables that grow with usage; a seq scan over them is a regression unless explicitly allowed
+LARGE_TABLES = {"tasks", "task_reminders"}
+
+# fixed reference time so seeded data and plans are reproducible between runs
+NOW = datetime(2026, 1, 1, 12, 0)
+
+# same batch size selectinload uses for "WHERE task_id IN (...)"
+SELECTIN_BATCH = 500
+
+SWEEP_BATCH = 500
+
+# tasks that went overdue more than this before NOW are seeded as already swept,
+# the rest (~1k tasks) is what the overdue sweep has to pick up
+SWEPT_BEFORE = timedelta(days=3)
+
+REMINDER_LEAD_TIMES = [timedelta(days=3), timedelta(days=1), timedelta(hours=1)]
+
+
+@dataclass
+class SeedContext:
+    now: datetime
+    task_id: int
+    page_ids: list[int]
+
+
+@dataclass
+class HotQuery:
+    name: str
+    build: Callable[[SeedContext], Executable]
+    allow_seq_scan: set[str] = field(default_factory=set)
+    # tables sqlite may walk in full on top of allow_seq_scan, for plans only its planner picks
+    sqlite_allow_scan: set[str] = field(default_factory=set)
+    max_buffers: int | None = None
+    max_rows: int | None = None
+
+
+HOT_QUERIES = [
+    # list_tasks and tasks_page render the whole table, a seq scan is expected there
+    HotQuery(
+        name="list_tasks",
+        build=lambda ctx: select(Task).order_by(Task.created_at.desc()),
+        allow_seq_scan={"tasks"},
+    ),
+    HotQuery(
+        name="list_tasks_include_reminders",
+        build=lambda ctx: select(TaskReminder).where(TaskReminder.task_id.in_(ctx.page_ids)),
+        max_buffers=4_000,
+        max_rows=5_000,
+    ),
+    HotQuery(
+        name="get_task",
+        build=lambda ctx: select(Task).where(Task.id == ctx.task_id),
+        max_buffers=10,
+        max_rows=1,
+    ),
+    HotQuery(
+        name="tasks_page_next_remind_at",
+        build=lambda ctx: (
+            select(TaskReminder.task_id, func.min(TaskReminder.remind_at))
+            .where(
+                TaskReminder.is_sent.is_(False),
+                TaskReminder.remind_at > ctx.now
+            )
+            .group_by(TaskReminder.task_id)
+        ),
+        # older sqlite (3.40) walks ix_task_reminders_task_id to get the GROUP BY order for
+        # free instead of searching the partial index, newer ones search it
+        sqlite_allow_scan={"task_reminders"},
+        max_buffers=2_000,
+        max_rows=150_000,
+    ),
+    HotQuery(
+        name="task_done_mark_reminders_sent",
+        build=lambda ctx: (
+            update(TaskReminder)
+            .where(TaskReminder.task_id == ctx.task_id, TaskReminder.is_sent.is_(False))
+            .values(is_sent=True)
+        ),
+        max_buffers=50,
+        max_rows=10,
+    ),
+    HotQuery(
+        name="update_task_page_delete_reminders",
+        build=lambda ctx: delete(TaskReminder).where(TaskReminder.task_id == ctx.task_id),
+        max_buffers=50,
+        max_rows=10,
+    ),
+    # only tasks that crossed their deadline since the last sweep should be touched
+    HotQuery(
+        name="overdue_sweep_mark",
+        build=lambda ctx: mark_overdue(ctx.now, SWEEP_BATCH),
+        # ~16 buffers per stamped task: new heap tuple plus tasks_pkey and ix_tasks_id entries
+        max_buffers=10_000,
+        max_rows=SWEEP_BATCH,
+    ),
+    HotQuery(
+        name="overdue_sweep_schedule_escalations",
+        build=lambda ctx: schedule_escalations(ctx.now, ctx.page_ids[:50]),
+        max_buffers=2_000,
+        max_rows=200,
+    ),
+]
+
+SEED_TASKS_SQL = text("""
+    INSERT INTO tasks (title, description, status, due_at, created_at, updated_at)
+    SELECT
+        'Task ' || g,
+        CASE WHEN g % 3 = 0 THEN NULL ELSE 'Description of task ' || g END,
+        (CASE
+            WHEN g % 20 < 12 THEN 'done'
+            WHEN g % 20 < 17 THEN 'pending'
+            ELSE 'in_progress'
+        END)::task_status,
+        CASE WHEN g % 5 = 0 THEN NULL ELSE CAST(:now AS timestamp) + (g % 360 - 180) * interval '1 day' END,
+        CAST(:now AS timestamp) - (g % 365) * interval '1 day',
+        CAST(:now AS timestamp) - (g % 365) * interval '1 day'
+    FROM generate_series(1, :tasks) AS g
+""")
+
+# three preset reminders per task with a deadline; done tasks have theirs marked as sent
+SEED_REMINDERS_SQL = text("""
+    INSERT INTO task_reminders (task_id, remind_at, is_sent, created_at)
+    SELECT
+        t.id,
+        t.due_at - r.lead_time,
+        t.status = 'done',
+        t.created_at
+    FROM tasks t
+    CROSS JOIN (VALUES (interval '3 days'), (interval '1 day'), (interval '1 hour')) AS r(lead_time)
+    WHERE t.due_at IS NOT NULL
+""")
+
+SEED_SWEPT_SQL = text("""
+    UPDATE tasks
+    SET overdue_at = due_at
+    WHERE status <> 'done' AND due_at <= CAST(:swept_before AS timestamp)
+""")
+
+
+def scratch_url(database: str) -> str:
+    url = make_url(settings.POSTGRES_URL.replace("+asyncpg", "+psycopg"))
+    return url.set(database=database).render_as_string(hide_password=False)
+
+
+def recreate_database(database: str) -> None:
+    admin = create_engine(scratch_url("postgres"), isolation_level="AUTOCOMMIT")
+    with admin.connect() as conn:
+        conn.execute(text(f'DROP DATABASE IF EXISTS "{database}"'))
+        conn.execute(text(f'CREATE DATABASE "{database}"'))
+    admin.dispose()
+
+
+def task_rows(tasks: int) -> list[dict]:
+    """Same distribution as SEED_TASKS_SQL/SEED_SWEPT_SQL, for backends without generate_series."""
+    rows = []
+    for g in range(1, tasks + 1):
+        if g % 20 < 12:
+            status = TaskStatus.done
+        elif g % 20 < 17:
+            status = TaskStatus.pending
+        else:
+            status = TaskStatus.in_progress
+        created_at = NOW - timedelta(days=g % 365)
+        due_at = None if g % 5 == 0 else NOW + timedelta(days=g % 360 - 180)
+        swept = status != TaskStatus.done and due_at is not None and due_at <= NOW - SWEPT_BEFORE
+        rows.append({
+            "title": f"Task {g}",
+            "description": None if g % 3 == 0 else f"Description of task {g}",
+            "status": status,
+            "due_at": due_at,
+            "overdue_at": due_at if swept else None,
+            "created_at": created_at,
+            "updated_at": created_at,
+        })
+    return rows
+
+
+def reminder_rows(tasks_with_deadline) -> list[dict]:
+    """Same as SEED_REMINDERS_SQL for (id, status, due_at, created_at) rows."""
+    return [
+        {
+            "task_id": task_id,
+            "remind_at": due_at - lead_time,
+            "is_sent": status == TaskStatus.done,
+            "created_at": created_at,
+        }
+        for task_id, status, due_at, created_at in tasks_with_deadline
+        for lead_time in REMINDER_LEAD_TIMES
+    ]
+
+
+def seed_postgres(engine: Engine, tasks: int) -> SeedContext:
+    Base.metadata.create_all(engine)
+
+    with engine.begin() as conn:
+        conn.execute(SEED_TASKS_SQL, {"now": NOW, "tasks": tasks})
+        conn.execute(SEED_REMINDERS_SQL)
+        conn.execute(SEED_SWEPT_SQL, {"swept_before": NOW - SWEPT_BEFORE})
+
+    # VACUUM refreshes the visibility map, otherwise index-only scans are never picked
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("VACUUM ANALYZE"))
+
+    return seed_context(engine)
+
+
+def seed_sqlite(engine: Engine, tasks: int) -> SeedContext:
+    Base.metadata.create_all(engine)
+
+    with engine.begin() as conn:
+        conn.execute(insert(Task), task_rows(tasks))
+        tasks_with_deadline = conn.execute(
+            select(Task.id, Task.status, Task.due_at, Task.created_at).where(Task.due_at.is_not(None))
+        ).all()
+        conn.execute(insert(TaskReminder), reminder_rows(tasks_with_deadline))
+        conn.execute(text("ANALYZE"))
+
+    return seed_context(engine)
+
+
+def seed_context(engine: Engine) -> SeedContext:
+    with engine.connect() as conn:
+        task_id = conn.execute(
+            select(Task.id)
+            .join(TaskReminder, TaskReminder.task_id == Task.id)
+            .where(Task.status == TaskStatus.pending, TaskReminder.is_sent.is_(False))
+            .order_by(Task.id)
+            .limit(1)
+        ).scalar_one()
+        page_ids = list(conn.execute(
+            select(Task.id).order_by(Task.id).limit(SELECTIN_BATCH)
+        ).scalars())
+
+    return SeedContext(now=NOW, task_id=task_id, page_ids=page_ids)
+
+
+def explain_postgres(engine: Engine, stmt: Executable) -> dict:
+    with engine.connect() as conn:
+        compiled = stmt.compile(dialect=conn.dialect, compile_kwargs={"render_postcompile": True})
+        try:
+            result = conn.exec_driver_sql(
+                f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {compiled}",
+                compiled.params,
+            )
+            plan = result.scalar_one()
+        finally:
+            # EXPLAIN ANALYZE really executes UPDATE/DELETE
+            conn.rollback()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]
+
+
+def explain_sqlite(engine: Engine, stmt: Executable) -> list[str]:
+    """EXPLAIN QUERY PLAN rendered as indented detail lines, e.g. "SEARCH tasks USING INDEX ..."."""
+    with engine.connect() as conn:
+        compiled = stmt.compile(dialect=conn.dialect, compile_kwargs={"render_postcompile": True})
+        params = tuple(
+            value.isoformat(" ") if isinstance(value, datetime) else value
+            for value in (compiled.params[name] for name in compiled.positiontup)
+        )
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params).all()
+
+    depths = {0: -1}
+    lines = []
+    for node_id, parent_id, _, detail in rows:
+        depths[node_id] = depths.get(parent_id, -1) + 1
+        lines.append("  " * depths[node_id] + detail)
+    return lines
+
+
+def iter_nodes(node: dict, depth: int = 0):
+    yield depth, node
+    for child in node.get("Plans", []):
+        yield from iter_nodes(child, depth + 1)
+
+
+def plan_shape(plan: dict) -> list[str]:
+    lines = []
+    for depth, node in iter_nodes(plan["Plan"]):
+        line = node["Node Type"]
+        if "Index Name" in node:
+            line += f" using {node['Index Name']}"
+        if "Relation Name" in node:
+            line += f" on {node['Relation Name']}"
+        lines.append("  " * depth + line)
+    return lines
+
+
+def rows_examined(plan: dict) -> int:
+    examined = 0
+    for _, node in iter_nodes(plan["Plan"]):
+        loops = node.get("Actual Loops", 1)
+        node_rows = (node.get("Actual Rows", 0) + node.get("Rows Removed by Filter", 0)) * loops
+        examined = max(examined, node_rows)
+    return examined
+
+
+def shared_buffers(plan: dict) -> int:
+    # buffer counters of the root node include all of its children
+    root = plan["Plan"]
+    return root.get("Shared Hit Blocks", 0) + root.get("Shared Read Blocks", 0)
+
+
+def baseline_diff(baseline: list[str] | None, shape: list[str]) -> str | None:
+    if baseline is None or baseline == shape:
+        return None
+    diff = difflib.unified_diff(baseline, shape, "baseline", "current", lineterm="")
+    return "plan changed:\n" + "\n".join(diff)
+
+
+def check_postgres(query: HotQuery, plan: dict, baseline: list[str] | None) -> list[str]:
+    problems = []
+
+    for _, node in iter_nodes(plan["Plan"]):
+        relation = node.get("Relation Name")
+        if node["Node Type"] == "Seq Scan" and relation in LARGE_TABLES - query.allow_seq_scan:
+            problems.append(f"seq scan on {relation}")
+
+    buffers = shared_buffers(plan)
+    if query.max_buffers is not None and buffers > query.max_buffers:
+        problems.append(f"{buffers} shared buffers, budget is {query.max_buffers}")
+
+    rows = rows_examined(plan)
+    if query.max_rows is not None and rows > query.max_rows:
+        problems.append(f"{rows} rows examined, budget is {query.max_rows}")
+
+    diff = baseline_diff(baseline, plan_shape(plan))
+    if diff:
+        problems.append(diff)
+
+    return problems
+
+
+def check_sqlite(query: HotQuery, shape: list[str], baseline: list[str] | None) -> list[str]:
+    problems = []
+
+    # "SCAN <table>" is a full pass over the table or one of its indexes, "SEARCH" is a lookup
+    for line in shape:
+        words = line.split()
+        if words[0] == "SCAN" and words[1] in LARGE_TABLES - query.allow_seq_scan - query.sqlite_allow_scan:
+            problems.append(f"full scan on {words[1]}")
+
+    diff = baseline_diff(baseline, shape)
+    if diff:
+        problems.append(diff)
+
+    return problems
+
+
+def report(name: str, summary: str, shape: list[str], problems: list[str]) -> None:
+    print(f"[{'FAIL' if problems else 'ok'}] {name}{summary}")
+    if problems:
+        print("\n".join("    " + line for line in shape))
+        for problem in problems:
+            print("  - " + problem.replace("\n", "\n      "))
+
+
+def run_postgres(database: str, tasks: int, baselines: dict) -> tuple[dict, bool]:
+    recreate_database(database)
+    engine = create_engine(scratch_url(database))
+    ctx = seed_postgres(engine, tasks)
+
+    shapes = {}
+    failed = False
+    for query in HOT_QUERIES:
+        plan = explain_postgres(engine, query.build(ctx))
+        shapes[query.name] = plan_shape(plan)
+        problems = check_postgres(query, plan, baselines.get(query.name))
+        failed = failed or bool(problems)
+        report(
+            query.name,
+            f": {plan['Execution Time']:.2f} ms, {shared_buffers(plan)} buffers, {rows_examined(plan)} rows",
+            shapes[query.name],
+            problems,
+        )
+
+    engine.dispose()
+    return shapes, failed
+
+
+def run_sqlite(tasks: int, baselines: dict) -> tuple[dict, bool]:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'query_plans.sqlite3'}")
+        ctx = seed_sqlite(engine, tasks)
+
+        shapes = {}
+        failed = False
+        for query in HOT_QUERIES:
+            shapes[query.name] = explain_sqlite(engine, query.build(ctx))
+            problems = check_sqlite(query, shapes[query.name], baselines.get(query.name))
+            failed = failed or bool(problems)
+            report(query.name, "", shapes[query.name], problems)
+
+        engine.dispose()
+    return shapes, failed
+
+
+def load_baselines(backend: str) -> dict[str, list[str]]:
+    baseline_path = BASELINE_PATHS[backend]
+    if not baseline_path.exists():
+        return {}
+    return json.loads(baseline_path.read_text(encoding="utf-8"))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=["postgres", "sqlite"], default=settings.DB_BACKEND)
+    parser.add_argument("--tasks", type=int, default=DEFAULT_TASKS, help="number of seeded tasks")
+    parser.add_argument("--database", default=f"{settings.POSTGRES_DB}_query_plans")
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    baselines = {} if args.update_baseline else load_baselines(args.backend)
+
+    if args.backend == "sqlite":
+        shapes, failed = run_sqlite(args.tasks, baselines)
+    else:
+        shapes, failed = run_postgres(args.database, args.tasks, baselines)
+
+    if args.update_baseline:
+        baseline_path = BASELINE_PATHS[args.backend]
+        baseline_path.write_text(json.dumps(shapes, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+        print(f"baseline written to {baseline_path}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+import os
+import tempfile
+from pathlib import Path
+
+# app.config reads the environment on import, so the backend has to be chosen first.
+# TEST_DB_BACKEND=postgres runs the suite against <POSTGRES_DB>_test (or TEST_POSTGRES_DB)
+# on the configured server, the default is a throwaway sqlite file
+os.environ["DB_BACKEND"] = os.environ.get("TEST_DB_BACKEND", "sqlite")
+os.environ["SQLITE_PATH"] = str(Path(tempfile.mkdtemp()) / "test.sqlite3")
+os.environ["OVERDUE_SWEEP_INTERVAL"] = "0"
+
+from app.config import settings
+
+if settings.DB_BACKEND == "postgres":
+    # the fixtures drop every table, so never point them at the app database
+    settings.POSTGRES_DB = os.environ.get("TEST_POSTGRES_DB", f"{settings.POSTGRES_DB}_test")
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, make_url, text
+
+from app.db import Base
+from app.main import app
+
+# plain sync driver for setup, the app's async engines are bound to the client's event loop
+SYNC_URL = settings.DATABASE_URL.replace("+asyncpg", "+psycopg").replace("+aiosqlite", "")
+
+
+@pytest.fixture(scope="session")
+def database():
+    if settings.DB_BACKEND != "postgres":
+        return
+
+    admin_url = make_url(SYNC_URL).set(database="postgres")
+    admin = create_engine(admin_url, isolation_level="AUTOCOMMIT")
+    with admin.connect() as conn:
+        exists = conn.execute(
+            text("SELECT 1 FROM pg_database WHERE datname = :name"),
+            {"name": settings.POSTGRES_DB},
+        ).scalar()
+        if not exists:
+            conn.execute(text(f'CREATE DATABASE "{settings.POSTGRES_DB}"'))
+    admin.dispose()
+
+
+@pytest.fixture
+def sync_engine(database):
+    engine = create_engine(SYNC_URL)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def client(sync_engine):
+    with TestClient(app) as client:
+        yield client
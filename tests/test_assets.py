@@ -0,0 +1,66 @@
+import shutil
+
+import pytest
+from starlette.applications import Starlette
+from starlette.routing import Mount
+from starlette.testclient import TestClient
+
+from app import assets
+
+
+@pytest.fixture
+def built_assets(tmp_path, monkeypatch):
+    # build a copy, build() wipes and rewrites dist/ and must not touch the working tree
+    static_dir = tmp_path.resolve() / "static"
+    shutil.copytree(assets.STATIC_DIR, static_dir, ignore=shutil.ignore_patterns("dist"))
+    monkeypatch.setattr(assets, "STATIC_DIR", static_dir)
+    monkeypatch.setattr(assets, "DIST_DIR", static_dir / "dist")
+    monkeypatch.setattr(assets, "MANIFEST_PATH", static_dir / "dist" / "manifest.json")
+
+    assets.build()
+    assets.load_manifest.cache_clear()
+    assets.asset_hashes.cache_clear()
+    yield assets.load_manifest()
+    assets.load_manifest.cache_clear()
+    assets.asset_hashes.cache_clear()
+
+
+@pytest.fixture
+def client(built_assets):
+    app = Starlette(routes=[Mount("/static", app=assets.AssetStaticFiles(directory=assets.STATIC_DIR))])
+    with TestClient(app) as client:
+        yield client
+
+
+def test_hashed_asset_is_served_immutable(client, built_assets):
+    hashed = built_assets["style.css"]
+    name_hash = hashed.split(".")[-2]
+
+    response = client.get(f"/static/dist/{hashed}", headers={"Accept-Encoding": "identity"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/css")
+    assert response.headers["cache-control"] == assets.IMMUTABLE_CACHE_CONTROL
+    assert response.headers["etag"] == f'"{name_hash}"'
+    assert "content-encoding" not in response.headers
+
+
+def test_precompressed_variant_is_negotiated(client, built_assets):
+    hashed = built_assets["style.css"]
+
+    response = client.get(f"/static/dist/{hashed}", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"] == f'"{hashed.split(".")[-2]}-gzip"'
+
+
+@pytest.mark.parametrize("suffix", [".gz", ".br"])
+def test_precompressed_variant_is_not_served_directly(client, built_assets, suffix):
+    response = client.get(f"/static/dist/{built_assets['style.css']}{suffix}")
+
+    assert response.status_code == 404
+
+
+def test_manifest_is_not_served(client, built_assets):
+    assert client.get("/static/dist/manifest.json").status_code == 404
@@ -0,0 +1,34 @@
+import pytest
+from pydantic import ValidationError
+
+from app.config import Settings
+
+POSTGRES_SETTINGS = ("POSTGRES_DB", "POSTGRES_USER", "POSTGRES_PASSWORD", "DB_HOST")
+
+
+@pytest.fixture
+def clean_env(monkeypatch):
+    for name in (*POSTGRES_SETTINGS, "DB_PORT"):
+        monkeypatch.delenv(name, raising=False)
+
+
+def test_postgres_backend_requires_connection_settings(clean_env):
+    with pytest.raises(ValidationError, match="POSTGRES_DB, POSTGRES_USER, POSTGRES_PASSWORD, DB_HOST"):
+        Settings(_env_file=None, DB_BACKEND="postgres")
+
+
+def test_postgres_backend_builds_url(clean_env):
+    settings = Settings(
+        _env_file=None,
+        DB_BACKEND="postgres",
+        POSTGRES_DB="pingmebot",
+        POSTGRES_USER="ping_user",
+        POSTGRES_PASSWORD="secret",
+        DB_HOST="db",
+    )
+    assert settings.DATABASE_URL == "postgresql+asyncpg://ping_user:secret@db:5432/pingmebot"
+
+
+def test_sqlite_backend_needs_no_postgres_settings(clean_env, tmp_path):
+    settings = Settings(_env_file=None, DB_BACKEND="sqlite", SQLITE_PATH=tmp_path / "db.sqlite3")
+    assert settings.DATABASE_URL == f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite3'}"
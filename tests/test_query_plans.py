@@ -0,0 +1,30 @@
+import os
+
+import pytest
+
+from app.config import settings
+from perf.query_plans import DEFAULT_TASKS, load_baselines, run_postgres, run_sqlite
+
+# seeding and explaining ~200k tasks takes a while, so the check is opt-in:
+# QUERY_PLANS_BACKEND=sqlite|postgres python -m pytest tests/test_query_plans.py
+BACKEND = os.environ.get("QUERY_PLANS_BACKEND")
+
+pytestmark = pytest.mark.skipif(
+    BACKEND not in ("sqlite", "postgres"),
+    reason="set QUERY_PLANS_BACKEND=sqlite or postgres to check the hot query plans",
+)
+
+
+def test_hot_query_plans(capsys):
+    tasks = int(os.environ.get("QUERY_PLANS_TASKS", DEFAULT_TASKS))
+    baselines = load_baselines(BACKEND)
+
+    if BACKEND == "postgres":
+        if settings.POSTGRES_DB is None:
+            pytest.skip("the POSTGRES_* settings are needed for the postgres plans")
+        _, failed = run_postgres(f"{settings.POSTGRES_DB}_query_plans", tasks, baselines)
+    else:
+        _, failed = run_sqlite(tasks, baselines)
+
+    # the report names the failing queries with their plans and baseline diffs
+    assert not failed, capsys.readouterr().out
@@ -0,0 +1,124 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import event, insert, select
+
+from app.config import settings
+from app.db import dispose_engines, engine
+from app.models import Task, TaskReminder
+from app.schemas.task import TaskStatus
+from app.sweeper import ESCALATION_DELAYS, sweep_overdue
+
+NOW = datetime(2026, 1, 1, 12, 0)
+
+
+def sweep(now: datetime) -> int:
+    async def run():
+        # the app's async engines are bound to the loop, drop their connections with it
+        try:
+            return await sweep_overdue(now)
+        finally:
+            await dispose_engines()
+
+    return asyncio.run(run())
+
+
+def add_task(engine, title: str, **values) -> int:
+    with engine.begin() as conn:
+        return conn.execute(
+            insert(Task).values(title=title, created_at=NOW, updated_at=NOW, **values)
+        ).inserted_primary_key[0]
+
+
+def overdue_at_by_title(engine) -> dict[str, datetime | None]:
+    with engine.connect() as conn:
+        return dict(conn.execute(select(Task.title, Task.overdue_at)).all())
+
+
+def reminder_count(engine) -> int:
+    with engine.connect() as conn:
+        return len(conn.execute(select(TaskReminder.id)).all())
+
+
+class UpdateCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("UPDATE"):
+            self.count += 1
+
+
+@pytest.fixture
+def update_counter():
+    counter = UpdateCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", counter)
+    yield counter
+    event.remove(engine.sync_engine, "before_cursor_execute", counter)
+
+
+def test_sweep_stamps_only_active_past_due_unswept_tasks(sync_engine):
+    swept_earlier = NOW - timedelta(days=1)
+    add_task(sync_engine, "pending", status=TaskStatus.pending, due_at=NOW - timedelta(hours=1))
+    add_task(sync_engine, "in_progress", status=TaskStatus.in_progress, due_at=NOW)
+    add_task(sync_engine, "done", status=TaskStatus.done, due_at=NOW - timedelta(hours=1))
+    add_task(sync_engine, "future", status=TaskStatus.pending, due_at=NOW + timedelta(minutes=1))
+    add_task(sync_engine, "no_deadline", status=TaskStatus.pending)
+    add_task(
+        sync_engine, "swept", status=TaskStatus.pending,
+        due_at=NOW - timedelta(days=2), overdue_at=swept_earlier,
+    )
+
+    assert sweep(NOW) == 2
+
+    assert overdue_at_by_title(sync_engine) == {
+        "pending": NOW,
+        "in_progress": NOW,
+        "done": None,
+        "future": None,
+        "no_deadline": None,
+        "swept": swept_earlier,
+    }
+
+
+def test_second_sweep_touches_nothing(sync_engine):
+    for i in range(3):
+        add_task(sync_engine, f"task {i}", due_at=NOW - timedelta(hours=i))
+    sweep(NOW)
+    stamped = overdue_at_by_title(sync_engine)
+    reminders = reminder_count(sync_engine)
+
+    assert sweep(NOW + timedelta(minutes=1)) == 0
+
+    assert overdue_at_by_title(sync_engine) == stamped
+    assert reminder_count(sync_engine) == reminders
+
+
+@pytest.mark.parametrize(("tasks", "updates"), [(1, 1), (4, 3), (5, 3)])
+def test_sweep_loops_over_batches(sync_engine, update_counter, monkeypatch, tasks, updates):
+    monkeypatch.setattr(settings, "OVERDUE_SWEEP_BATCH", 2)
+    for i in range(tasks):
+        add_task(sync_engine, f"task {i}", due_at=NOW - timedelta(hours=i))
+
+    assert sweep(NOW) == tasks
+
+    # a full batch means there may be more, so a batch that divides the count ends with an empty round
+    assert update_counter.count == updates
+    assert all(overdue_at == NOW for overdue_at in overdue_at_by_title(sync_engine).values())
+
+
+def test_sweep_schedules_one_reminder_per_escalation_delay(sync_engine):
+    task_ids = [add_task(sync_engine, f"task {i}", due_at=NOW - timedelta(hours=i)) for i in range(3)]
+    add_task(sync_engine, "future", due_at=NOW + timedelta(days=1))
+
+    sweep(NOW)
+
+    with sync_engine.connect() as conn:
+        rows = conn.execute(select(TaskReminder.task_id, TaskReminder.remind_at, TaskReminder.is_sent)).all()
+    assert len(rows) == len(task_ids) * len(ESCALATION_DELAYS)
+    for task_id in task_ids:
+        assert sorted(remind_at for tid, remind_at, _ in rows if tid == task_id) == [
+            NOW + delay for delay in ESCALATION_DELAYS
+        ]
+    assert not any(is_sent for _, _, is_sent in rows)
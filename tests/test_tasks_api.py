@@ -0,0 +1,131 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event, insert
+
+from app.db import read_engine
+from app.models import Task, TaskReminder
+
+
+def seed_tasks(engine, count: int) -> None:
+    now = datetime.utcnow()
+    with engine.begin() as conn:
+        for i in range(count):
+            task_id = conn.execute(
+                insert(Task).values(title=f"Task {i}", due_at=now + timedelta(days=1), created_at=now, updated_at=now)
+            ).inserted_primary_key[0]
+            conn.execute(insert(TaskReminder), [
+                {"task_id": task_id, "remind_at": now + timedelta(hours=hours), "created_at": now}
+                for hours in (1, 12)
+            ])
+
+
+class SelectCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            self.count += 1
+
+
+@pytest.fixture
+def select_counter():
+    counter = SelectCounter()
+    event.listen(read_engine.sync_engine, "before_cursor_execute", counter)
+    yield counter
+    event.remove(read_engine.sync_engine, "before_cursor_execute", counter)
+
+
+@pytest.mark.parametrize("tasks", [1, 5, 30])
+def test_list_tasks_include_reminders_query_count(client, sync_engine, select_counter, tasks):
+    seed_tasks(sync_engine, tasks)
+
+    response = client.get("/tasks/", params={"include": "reminders"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert len(body) == tasks
+    assert all(len(task["reminders"]) == 2 for task in body)
+    assert select_counter.count == 2
+
+
+@pytest.mark.parametrize("tasks", [1, 30])
+def test_list_tasks_without_include_query_count(client, sync_engine, select_counter, tasks):
+    seed_tasks(sync_engine, tasks)
+
+    response = client.get("/tasks/")
+
+    assert response.status_code == 200
+    assert all("reminders" not in task for task in response.json())
+    assert select_counter.count == 1
+
+
+def test_get_task_include_reminders(client, sync_engine, select_counter):
+    seed_tasks(sync_engine, 3)
+
+    response = client.get("/tasks/1", params={"include": "reminders"})
+
+    assert response.status_code == 200
+    assert len(response.json()["reminders"]) == 2
+    assert select_counter.count == 2
+
+
+def test_unknown_include_is_rejected(client, sync_engine):
+    seed_tasks(sync_engine, 1)
+
+    assert client.get("/tasks/", params={"include": "foo"}).status_code == 400
+    assert client.get("/tasks/1", params={"include": "foo"}).status_code == 400
+
+
+def seed_overdue_task(engine) -> datetime:
+    now = datetime.utcnow().replace(microsecond=0)
+    due_at = now - timedelta(hours=1)
+    with engine.begin() as conn:
+        conn.execute(insert(Task).values(
+            title="Overdue", due_at=due_at, overdue_at=now, created_at=now, updated_at=now
+        ))
+    return due_at
+
+
+def test_create_task(client, sync_engine):
+    due_at = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(days=1)
+
+    response = client.post("/tasks/", json={"title": "Task", "due_at": due_at.isoformat()})
+
+    assert response.status_code == 201
+    body = response.json()
+    assert body["due_at"] == due_at.replace(tzinfo=None).isoformat()
+    assert body["overdue_at"] is None
+
+
+def test_patch_keeps_overdue_at_when_due_at_is_resent(client, sync_engine):
+    due_at = seed_overdue_task(sync_engine)
+
+    response = client.patch("/tasks/1", json={
+        "status": "done",
+        "due_at": due_at.replace(tzinfo=timezone.utc).isoformat(),
+    })
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "done"
+    assert response.json()["overdue_at"] is not None
+
+
+def test_patch_resets_overdue_at_when_due_at_changes(client, sync_engine):
+    seed_overdue_task(sync_engine)
+    new_due_at = datetime.utcnow().replace(microsecond=0) + timedelta(days=1)
+
+    response = client.patch("/tasks/1", json={"due_at": new_due_at.isoformat()})
+
+    assert response.status_code == 200
+    assert response.json()["due_at"] == new_due_at.isoformat()
+    assert response.json()["overdue_at"] is None
+
+
+def test_patch_rejects_new_past_due_at(client, sync_engine):
+    due_at = seed_overdue_task(sync_engine)
+
+    response = client.patch("/tasks/1", json={"due_at": (due_at - timedelta(days=1)).isoformat()})
+
+    assert response.status_code == 400